@@ -0,0 +1,157 @@
+"""Numeric kernels behind the bulk point-lookup API of :pymod:`soil_temp_lookup`.
+
+The hot loop (lon/lat → row/col → pixel → nodata → NaN) is compiled with
+Numba and run in parallel over the points when Numba is installed.  Without
+it, an equivalent vectorised NumPy implementation with the same signature is
+used instead, so callers never need to care which one they got.
+
+The band is quantised to ``int16`` hundredths of a degree (see
+:pyfunc:`quantize`) – half the bytes of ``float32`` for far more precision
+than the data carries – and stored as square ``TILE × TILE`` blocks (see
+:pyfunc:`to_tiles`)
+so that spatially close pixels share cache lines, and batch queries are
+visited in Z-order (Morton) of their tile via :pyfunc:`morton_order` so that
+consecutive lookups keep hitting the same few tiles.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    # Optional: the NumPy fallback below is correct, just slower on big batches.
+    from numba import njit, prange  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – optional dependency
+    njit = None  # type: ignore
+
+SCALE = 100.0  # stored value = round(°C × SCALE)
+SENTINEL = np.iinfo(np.int16).min  # nodata marker in the quantised band
+
+TILE_SHIFT = 6
+TILE = 1 << TILE_SHIFT  # 64×64 int16 tile = 8 KiB
+TILE_MASK = TILE - 1
+
+
+def nodata_mask(arr: np.ndarray, nodata: float | None) -> np.ndarray:
+    """Return a boolean mask of the NaN and *nodata* pixels of *arr*.
+
+    GDAL reports *nodata* as a float64; it is cast to ``arr.dtype`` before an
+    exact ``==`` so that e.g. a float32 sentinel matches bit for bit without
+    the cost and fuzziness of ``np.isclose``.  A *nodata* the dtype cannot
+    represent matches nothing.
+    """
+    invalid = np.isnan(arr) if arr.dtype.kind == "f" else np.zeros(arr.shape, dtype=bool)
+    if nodata is None:
+        return invalid
+    if arr.dtype.kind in "iu":
+        info = np.iinfo(arr.dtype)
+        if not (float(nodata).is_integer() and info.min <= nodata <= info.max):
+            return invalid
+    invalid |= arr == arr.dtype.type(nodata)
+    return invalid
+
+
+def quantize(arr: np.ndarray, nodata: float | None) -> np.ndarray:
+    """Return *arr* as ``int16`` of ``round(value × SCALE)``.
+
+    NaN and *nodata* pixels become :pydata:`SENTINEL`; values beyond
+    ±327.67 are clipped (no soil on this planet gets there).
+    """
+    invalid = nodata_mask(arr, nodata)
+
+    scaled = arr.astype(np.float32)  # always a copy we can work on in place
+    scaled[invalid] = 0  # before scaling: a ±3.4e38 sentinel would overflow
+    scaled *= np.float32(SCALE)
+    np.rint(scaled, out=scaled)
+    np.clip(scaled, SENTINEL + 1, np.iinfo(np.int16).max, out=scaled)
+    q = scaled.astype(np.int16)
+    q[invalid] = SENTINEL
+    return q
+
+
+def to_tiles(arr: np.ndarray, fill: float = SENTINEL) -> np.ndarray:
+    """Reblock 2-D *arr* into a C-contiguous ``(n_tiles_y, n_tiles_x, TILE, TILE)`` array.
+
+    Pixel ``(row, col)`` lives at ``[row >> TILE_SHIFT, col >> TILE_SHIFT,
+    row & TILE_MASK, col & TILE_MASK]``.  The ragged right/bottom edge is
+    padded with *fill*; callers bounds-check against the original shape.
+    """
+    height, width = arr.shape
+    nty, ntx = -(-height // TILE), -(-width // TILE)
+    padded = np.full((nty * TILE, ntx * TILE), fill, dtype=arr.dtype)
+    padded[:height, :width] = arr
+    return np.ascontiguousarray(padded.reshape(nty, TILE, ntx, TILE).swapaxes(1, 2))
+
+
+def _spread_bits(v: np.ndarray) -> np.ndarray:
+    """Insert a zero bit between each of the low 32 bits of *v*."""
+    v = v.astype(np.uint64) & 0xFFFFFFFF
+    v = (v | (v << 16)) & 0x0000FFFF0000FFFF
+    v = (v | (v << 8)) & 0x00FF00FF00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F0F0F0F0F
+    v = (v | (v << 2)) & 0x3333333333333333
+    v = (v | (v << 1)) & 0x5555555555555555
+    return v
+
+
+def morton_order(lats, lons, inv, height, width) -> np.ndarray:
+    """Return the permutation that sorts points by the Morton key of their tile."""
+    a, b, c, d, e, f = inv
+    with np.errstate(invalid="ignore"):  # inf × 0 → NaN
+        ys = np.floor(lons * d + lats * e + f)
+        xs = np.floor(lons * a + lats * b + c)
+    # Non-finite points sample as NaN wherever they sort; park them in tile 0
+    # so that the int cast stays defined.
+    ys[~np.isfinite(ys)] = 0
+    xs[~np.isfinite(xs)] = 0
+    rows = np.clip(ys, 0, height - 1).astype(np.int64)
+    cols = np.clip(xs, 0, width - 1).astype(np.int64)
+    keys = (_spread_bits(rows >> TILE_SHIFT) << 1) | _spread_bits(cols >> TILE_SHIFT)
+    return np.argsort(keys, kind="stable")
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def sample_points(tiles, height, width, lats, lons, inv, out):  # pragma: no cover – compiled
+        """Write the pixel under each (lat, lon) into *out*.
+
+        *tiles* is the band as returned by :pyfunc:`to_tiles` for a raster of
+        *height* × *width* pixels; *inv* holds the ``(a, b, c, d, e, f)``
+        coefficients of the inverse affine transform.  Values are returned in
+        °C; points off the raster or on :pydata:`SENTINEL` become NaN.
+        """
+        a, b, c, d, e, f = inv
+        for i in prange(lats.shape[0]):
+            y = np.floor(lons[i] * d + lats[i] * e + f)
+            x = np.floor(lons[i] * a + lats[i] * b + c)
+            # Bounds-check the floats: NaN/inf fail it, so they are never
+            # cast to int (undefined behaviour).
+            if 0 <= y < height and 0 <= x < width:
+                row, col = int(y), int(x)
+                v = tiles[row >> TILE_SHIFT, col >> TILE_SHIFT, row & TILE_MASK, col & TILE_MASK]
+                out[i] = np.nan if v == SENTINEL else v / SCALE
+            else:
+                out[i] = np.nan
+
+else:
+
+    def sample_points(tiles, height, width, lats, lons, inv, out):
+        """Write the pixel under each (lat, lon) into *out*.
+
+        *tiles* is the band as returned by :pyfunc:`to_tiles` for a raster of
+        *height* × *width* pixels; *inv* holds the ``(a, b, c, d, e, f)``
+        coefficients of the inverse affine transform.  Values are returned in
+        °C; points off the raster or on :pydata:`SENTINEL` become NaN.
+        """
+        a, b, c, d, e, f = inv
+        with np.errstate(invalid="ignore"):  # inf × 0 → NaN, rejected below
+            ys = np.floor(lons * d + lats * e + f)
+            xs = np.floor(lons * a + lats * b + c)
+        # Bounds-check the floats: NaN/inf fail it, so only finite in-range
+        # indices are cast to int.
+        inside = (ys >= 0) & (ys < height) & (xs >= 0) & (xs < width)
+
+        out[:] = np.nan
+        rows, cols = ys[inside].astype(np.intp), xs[inside].astype(np.intp)
+        vals = tiles[rows >> TILE_SHIFT, cols >> TILE_SHIFT, rows & TILE_MASK, cols & TILE_MASK]
+        out[inside] = np.where(vals == SENTINEL, np.nan, vals / SCALE)
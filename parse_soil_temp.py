@@ -3,7 +3,7 @@
 
 Usage
 -----
-python parse_soil_temp.py [PATH_TO_TIF]
+python parse_soil_temp.py [PATH_TO_TIF] [--no-plot] [--demo]
 If the path is omitted the script looks for
 `SBIO1_Annual_Mean_Temperature_5_15cm.tif` in the current directory.
 
@@ -23,11 +23,20 @@ except Exception:  # pragma: no cover – safe fallback in minimal environments
 
 import numpy as np
 import rasterio
+
+try:
+    # Optional: bottleneck's nanmin/nanmax are several times faster than NumPy's.
+    import bottleneck as bn  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – optional dependency
+    bn = None  # type: ignore
 from rasterio.plot import show
+from rasterio.transform import Affine
 
+from _kernel import nodata_mask
 from soil_temp_lookup import get_soil_temperature
 
 DEFAULT_TIF = "SBIO1_Annual_Mean_Temperature_5_15cm.tif"
+PLOT_MAX_SIZE = (1600, 800)  # (width, height) in pixels – ample for a 12×6" figure
 
 def main(tif_path: str | Path = DEFAULT_TIF, *, show_plot: bool = True) -> None:  # noqa: D401
     """Run the analysis given a path to a GeoTIFF.
@@ -57,21 +66,30 @@ def main(tif_path: str | Path = DEFAULT_TIF, *, show_plot: bool = True) -> None:
 
     # Create a GDAL / PROJ environment context so that Rasterio handles
     # internal data paths correctly – avoids clashes with system installs.
-    with rasterio.Env():
+    # Every block is read exactly once, so GDAL's block cache would only cost
+    # memory; decompression may use every core.
+    with rasterio.Env(GDAL_CACHEMAX=0, GDAL_NUM_THREADS="ALL_CPUS"):
         with rasterio.open(tif) as src:
             print("=== Metadata ===")
             for k, v in src.profile.items():
                 print(f"{k}: {v}")
 
-            # Read the only band into a 2-D masked NumPy array
-            data = src.read(1, masked=True)
-
-            # Basic global statistics – nodata values are masked so we can use
-            # the simple nan* reducers from NumPy.
+            # Read the only band as float32 with nodata turned into NaN – the
+            # nan* reducers ignore a MaskedArray's mask, so NaN is what they
+            # actually need.
+            raw = src.read(1)
+            data = raw.astype(np.float32, copy=False)
+            if src.nodata is not None:
+                data = np.where(nodata_mask(raw, src.nodata), np.nan, data)
+
+            # Basic global statistics over the valid pixels.  The mean is
+            # accumulated in float64: bottleneck (and a float32 accumulator
+            # in general) drifts by tenths of a degree over a global band.
+            nan_ops = bn if bn is not None else np
             stats = {
-                "min (°C)": np.nanmin(data),
-                "mean (°C)": np.nanmean(data),
-                "max (°C)": np.nanmax(data),
+                "min (°C)": nan_ops.nanmin(data),
+                "mean (°C)": np.nanmean(data, dtype=np.float64),
+                "max (°C)": nan_ops.nanmax(data),
             }
 
             print("\n=== Global stats ===")
@@ -79,11 +97,15 @@ def main(tif_path: str | Path = DEFAULT_TIF, *, show_plot: bool = True) -> None:
                 print(f"{k:<10} {v:6.2f}")
 
             if show_plot:
-                # Quick-look plot – false-color world map.
+                # Quick-look plot – false-color world map.  Matplotlib can't
+                # show more pixels than the figure has, so stride the band
+                # down to roughly screen size first.
+                xs = max(1, data.shape[1] // PLOT_MAX_SIZE[0])
+                ys = max(1, data.shape[0] // PLOT_MAX_SIZE[1])
                 fig, ax = plt.subplots(figsize=(12, 6))  # type: ignore[attr-defined]
                 show(
-                    data,
-                    transform=src.transform,
+                    data[::ys, ::xs],
+                    transform=src.transform * Affine.scale(xs, ys),
                     ax=ax,
                     cmap="RdYlBu_r",
                     title="Annual mean soil T (5–15 cm)",
@@ -102,13 +124,16 @@ def _cli() -> None:  # noqa: D401
                         help="Path to the raster file (defaults to the global dataset).")
     parser.add_argument("--no-plot", dest="no_plot", action="store_true",
                         help="Skip the quick-look plot – useful on headless systems.")
+    parser.add_argument("--demo", action="store_true",
+                        help="Afterwards, look up a sample address and coordinate.")
 
     args = parser.parse_args()
     main(args.tif, show_plot=not args.no_plot)
 
+    if args.demo:
+        print(get_soil_temperature("Paris, France", tif_path=args.tif))       # address
+        print(get_soil_temperature((48.8584, 2.2945), tif_path=args.tif))     # lat/lon
+
 
 if __name__ == "__main__":
     _cli()
-
-print(get_soil_temperature("Paris, France"))       # address
-print(get_soil_temperature((48.8584, 2.2945)))     # lat/lon 
\ No newline at end of file
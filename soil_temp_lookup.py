@@ -1,9 +1,10 @@
 #!/usr/bin/env python
 """Lookup annual mean soil temperature (5–15 cm) for a street address.
 
-The module exposes a single convenience function :pyfunc:`get_soil_temperature`
-which can be imported in other programs, and a small CLI that you can run from
-shell:
+The module exposes the convenience functions :pyfunc:`get_soil_temperature`
+(single point) and :pyfunc:`get_soil_temperatures` /
+:pyfunc:`get_soil_temperatures_batch` (many points at once) which can be
+imported in other programs, and a small CLI that you can run from shell:
 
     python soil_temp_lookup.py "1600 Amphitheatre Parkway, Mountain View, CA"
 
@@ -11,25 +12,69 @@ The implementation is *fast* because:
 
 1.  The global GeoTIFF is opened **once** and kept in an in-memory cache so
     subsequent queries don't pay the costly GDAL open penalty.
-2.  Address → (lat, lon) geocoding results are memoised via
-    :pyfunc:`functools.lru_cache` (configurable size).
-3.  We sample a *single* pixel with :pyfunc:`rasterio.DatasetReader.sample` – no
-    full-raster reads.
-4.  If the raster is not in geographic CRS (EPSG:4326) we transparently wrap
-    it in a lightweight in-memory :pyclass:`rasterio.vrt.WarpedVRT`, avoiding
-    the overhead of writing temporary files.
+2.  Address → (lat, lon) geocoding results are persisted in a small SQLite
+    cache (:pydata:`GEOCODE_DB`) so they survive across processes, with a
+    :pyfunc:`functools.lru_cache` in front for hot in-process reuse.
+3.  Point lookups never touch GDAL after the first call: the band is read
+    **once** into ``int16`` 64×64 tiles (0.01 °C steps, half the memory of
+    ``float32``) and every query (single or batch) is plain array indexing
+    through the cached inverse affine.  Batch lookups run in a
+    Numba-compiled, parallel kernel when Numba is installed and can
+    optionally be visited in Z-order of their tile.  Uncompressed EPSG:4326
+    GeoTIFFs are loaded straight from a memory map of the file, bypassing
+    GDAL entirely.
+4.  If the raster is not in geographic CRS (EPSG:4326) it is reprojected
+    **once** into a tiled, compressed GeoTIFF with overviews next to the
+    source (``<tif>.4326.tif``) and that file is opened from then on, so no
+    read ever runs the warp kernel again.  Where that file cannot be written
+    we fall back to an in-memory :pyclass:`rasterio.vrt.WarpedVRT`.
+5.  The preprocessed band is cached next to the raster as ``.npy`` (plus a
+    ``.meta.json``) and memory-mapped on later runs, so short-lived CLI
+    invocations skip GDAL and the preprocessing altogether.  Servers can set
+    :pydata:`SHARED_MEMORY_ENV` to also publish a freshly built band to
+    :pyclass:`multiprocessing.shared_memory.SharedMemory`, so forked workers
+    attach to one copy instead of each building their own (see
+    :pyfunc:`close_shared`).
 """
 from __future__ import annotations
 
+import atexit
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import closing, suppress
 from functools import lru_cache
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Final, Tuple
+from typing import Any, Final, NamedTuple, Sequence, Tuple
 
 import numpy as np
 import rasterio
+from rasterio._err import CPLE_BaseError
+from rasterio.crs import CRS
+from rasterio.enums import Resampling
+from rasterio.errors import RasterioError
+from rasterio.shutil import copy as copy_dataset
 from rasterio.vrt import WarpedVRT
+from rasterio.windows import Window
 from rasterio.warp import transform
 
+from _kernel import (
+    SCALE,
+    SENTINEL,
+    TILE_MASK,
+    TILE_SHIFT,
+    morton_order,
+    nodata_mask,
+    quantize,
+    sample_points,
+    to_tiles,
+)
+
 try:
     # Lazy import so that users without geopy can still import the module
     # for direct lon/lat queries.
@@ -42,12 +87,152 @@ except ModuleNotFoundError:  # pragma: no cover – optional dependency
 # -----------------------------------------------------------------------------
 
 DEFAULT_TIF: Final[str] = "SBIO1_Annual_Mean_Temperature_5_15cm.tif"
+GEOCODE_DB: Final[Path] = Path("~/.cache/soil-temp-lookup/geocode.sqlite").expanduser()
+# Set to "1" to publish freshly built bands to shared memory (multi-worker servers).
+SHARED_MEMORY_ENV: Final[str] = "SOIL_TEMP_SHARED_MEMORY"
 _GEOLOCATOR_CACHE: Final[dict[str, "Nominatim"]] = {}
+_CACHE_SIZE: Final[int] = 4  # open datasets / preloaded rasters kept per process
+_WGS84: Final[CRS] = CRS.from_epsg(4326)
+_PIXEL_EPS: Final[float] = 1e-6  # tolerance (in pixels) for bbox edges on pixel boundaries
+_SHM_HEADER: Final[int] = 4096  # ready flag + JSON metadata, then the tiles
+_WARP_BLOCK: Final[int] = 256  # tile size of the pre-warped EPSG:4326 copy
+_WARP_SOURCE_TAG: Final[str] = "SOURCE_STAMP"  # pre-warped copy → version of its source
+# GDAL options read when a dataset is opened: every core for decompression.
+_GDAL_OPEN_ENV: Final[dict[str, str]] = {"GDAL_NUM_THREADS": "ALL_CPUS"}
+# Added for remote (/vsi*) rasters only: skips a directory listing per open,
+# but would also hide local .aux.xml / .ovr / .msk sidecars (e.g. PAM nodata).
+_GDAL_REMOTE_ENV: Final[dict[str, str]] = {"GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR"}
+_GDAL_CACHE_BYTES: Final[int] = 512 << 20  # block cache for window reads (vs. 5 % of RAM)
 
 # -----------------------------------------------------------------------------
 # Internal helpers
 # -----------------------------------------------------------------------------
 
+class _LRU:
+    """Tiny least-recently-used map that ``close()``-s the entries it evicts.
+
+    Keeps file descriptors and mappings bounded when many different rasters
+    are queried from one process.  Entries without a ``close()`` are simply
+    dropped, which releases whatever they map once the last reference goes.
+    """
+
+    def __init__(self, cap: int = _CACHE_SIZE) -> None:
+        self.cap = cap
+        self._d: OrderedDict[str, Any] = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        value = self._d.get(key)
+        if value is not None:
+            self._d.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._d[key] = value
+        self._d.move_to_end(key)
+        while len(self._d) > self.cap:
+            _, old = self._d.popitem(last=False)
+            close = getattr(old, "close", None)
+            if close is not None:
+                close()
+
+    def pop(self, key: str) -> Any:
+        return self._d.pop(key, None)
+
+    def items(self) -> list[tuple[str, Any]]:
+        return list(self._d.items())
+
+
+def _is_wgs84(crs: CRS) -> bool:
+    """Return True if *crs* is WGS 84 lon/lat, however it is tagged.
+
+    Besides EPSG:4326 itself this accepts PROJ strings and renamed WKT that
+    PROJ identifies as EPSG:4326, and OGC:CRS84 (same system, lon/lat axis
+    order – GDAL already treats 4326 as lon/lat, so no swap is needed).
+    """
+    if crs == _WGS84:
+        return True
+    return crs.is_geographic and crs.to_authority() in {("EPSG", "4326"), ("OGC", "CRS84")}
+
+
+class _OwningWarpedVRT(WarpedVRT):
+    """:pyclass:`~rasterio.vrt.WarpedVRT` that also closes its source dataset.
+
+    The dataset cache only holds the VRT, so evicting it must release the
+    underlying file as well.
+    """
+
+    def close(self) -> None:
+        super().close()
+        self.src_dataset.close()
+
+
+def _open_prewarped(src: rasterio.DatasetReader) -> rasterio.DatasetReader:
+    """Return *src* reprojected to EPSG:4326, from a cached copy on disk.
+
+    The first call writes ``<tif>.4326.tif`` (tiled, deflate, with average
+    overviews) next to the source; later calls – and other processes – just
+    open it.  The copy carries the :pyfunc:`_source_stamp` of the raster it
+    was built from and is rebuilt when that no longer matches.  If it cannot
+    be written (e.g. read-only data directory) *src* is wrapped in a
+    :pyclass:`~rasterio.vrt.WarpedVRT` instead, which warps on every read.
+    """
+    source = Path(src.name)
+    dst = source.with_name(source.name + ".4326.tif")
+    try:
+        stamp = _source_stamp(source)
+    except OSError:  # not a local file
+        return _OwningWarpedVRT(src, crs=_WGS84)
+
+    try:
+        cached = rasterio.open(dst)
+    except (OSError, RasterioError, CPLE_BaseError):  # not built yet, or unreadable
+        cached = None
+    if cached is not None:
+        if cached.tags().get(_WARP_SOURCE_TAG) == stamp:
+            src.close()
+            return cached
+        cached.close()
+
+    # Write-then-rename so a concurrent reader never sees a partial file.
+    tmp = dst.with_name(f"{dst.name}.{os.getpid()}.tmp")
+    try:
+        with WarpedVRT(src, crs=_WGS84) as vrt:
+            copy_dataset(
+                vrt, tmp, driver="GTiff", tiled=True, compress="deflate",
+                blockxsize=_WARP_BLOCK, blockysize=_WARP_BLOCK,
+            )
+        with rasterio.open(tmp, "r+") as out:
+            factors = []
+            while max(out.width, out.height) // (2 << len(factors)) >= _WARP_BLOCK:
+                factors.append(2 << len(factors))
+            if factors:
+                out.build_overviews(factors, Resampling.average)
+            out.update_tags(**{_WARP_SOURCE_TAG: stamp})
+        os.replace(tmp, dst)
+    except (OSError, RasterioError, CPLE_BaseError):  # GDAL raises the latter
+        with suppress(OSError):
+            tmp.unlink(missing_ok=True)
+        return _OwningWarpedVRT(src, crs=_WGS84)
+
+    src.close()
+    return rasterio.open(dst)
+
+
+@lru_cache(maxsize=None)
+def _size_gdal_cache() -> None:
+    """Size GDAL's process-wide block cache to :pydata:`_GDAL_CACHE_BYTES`, once.
+
+    Left alone if the caller sized it already, through the ``GDAL_CACHEMAX``
+    environment variable or an enclosing ``rasterio.Env(GDAL_CACHEMAX=...)``.
+    Rasterio hands the value to ``GDALSetCacheMax64``, i.e. in bytes.
+    """
+    if "GDAL_CACHEMAX" in os.environ:
+        return
+    if rasterio.env.hasenv() and "GDAL_CACHEMAX" in rasterio.env.getenv():
+        return
+    rasterio.env.set_gdal_config("GDAL_CACHEMAX", _GDAL_CACHE_BYTES)
+
+
 def _get_dataset(path: str | Path = DEFAULT_TIF) -> rasterio.DatasetReader:
     """Return a cached, ready-to-use Rasterio dataset (possibly warped to EPSG:4326)."""
     p = str(Path(path).expanduser().resolve())
@@ -55,19 +240,23 @@ def _get_dataset(path: str | Path = DEFAULT_TIF) -> rasterio.DatasetReader:
     if ds is not None:
         return ds  # type: ignore[return-value]
 
-    base = rasterio.open(p)
-    if base.crs is None:
-        raise RuntimeError("Raster has no CRS – cannot locate coordinates.")
+    _size_gdal_cache()
+    env = dict(_GDAL_OPEN_ENV, **(_GDAL_REMOTE_ENV if p.startswith("/vsi") else {}))
+    with rasterio.Env(**env):
+        base = rasterio.open(p)
+        if base.crs is None:
+            raise RuntimeError("Raster has no CRS – cannot locate coordinates.")
 
-    if base.crs.to_epsg() != 4326:
-        base = WarpedVRT(base, crs="EPSG:4326")  # lightweight virtual reprojection
+        if not _is_wgs84(base.crs):
+            base = _open_prewarped(base)
     _get_dataset.cache_set(p, base)  # type: ignore[attr-defined]
     return base
 
 
 # Monkey-patch simple cache helpers instead of functools.lru_cache (we need to
-# store mutable DatasetReader objects that are not hashable).
-_get_dataset._cache = {}  # type: ignore[attr-defined]
+# store mutable DatasetReader objects that are not hashable, and close them on
+# eviction).
+_get_dataset._cache = _LRU()  # type: ignore[attr-defined]
 
 
 def _get_dataset_cache_get(key):  # type: ignore[no-self-use]
@@ -75,7 +264,7 @@ def _get_dataset_cache_get(key):  # type: ignore[no-self-use]
 
 
 def _get_dataset_cache_set(key, value):  # type: ignore[no-self-use]
-    _get_dataset._cache[key] = value
+    _get_dataset._cache.set(key, value)
 
 
 # Attach helpers to function object so they're in the same namespace.
@@ -83,9 +272,322 @@ _get_dataset.cache_get = _get_dataset_cache_get  # type: ignore[attr-defined]
 _get_dataset.cache_set = _get_dataset_cache_set  # type: ignore[attr-defined]
 
 
-@lru_cache(maxsize=2048)
+class _Raster(NamedTuple):
+    """Fully preloaded band plus what is needed to index it by lon/lat."""
+
+    # Segment backing *tiles* when shared.  Listed first so that it outlives
+    # *tiles* when the tuple is freed: a segment can't be closed while an
+    # array still views it.
+    shm: SharedMemory | None
+    tiles: np.ndarray  # band quantised and reblocked by :pymod:`_kernel`
+    height: int
+    width: int
+    inv: Tuple[float, float, float, float, float, float]  # (a, b, c, d, e, f) of ~transform
+    rectilinear: bool  # inverse has no rotation/shear terms (b == d == 0)
+
+
+_RASTER_CACHE: Final[_LRU] = _LRU()
+
+
+def _mmap_band(ds: rasterio.DatasetReader) -> np.ndarray | None:
+    """Read band 1 straight from a memory map of the file, or return *None*.
+
+    Only uncompressed, strip-organised, single-band GeoTIFFs qualify: their
+    pixels are raw bytes at the strip offsets recorded in the TIFF header, so
+    we can skip GDAL's decode and block cache entirely.  When the strips are
+    stored back to back the result is a zero-copy view; otherwise (GDAL
+    writes all-nodata strips last) each strip is copied into place.
+    Everything else (compressed, tiled, bit-packed, warped, multi-band) gets
+    *None*.
+    """
+    if isinstance(ds, WarpedVRT) or ds.driver != "GTiff" or ds.count != 1 or ds.compression is not None:
+        return None
+    if "NBITS" in ds.tags(1, ns="IMAGE_STRUCTURE"):  # sub-byte pixels packed into bytes
+        return None
+    rows_per_strip, block_width = ds.block_shapes[0]
+    if block_width != ds.width:  # tiled layout
+        return None
+
+    n_strips = -(-ds.height // rows_per_strip)
+    offsets = [ds.get_tag_item(f"BLOCK_OFFSET_0_{i}", "TIFF", bidx=1) for i in range(n_strips)]
+    if None in offsets:
+        return None
+    offsets = [int(o) for o in offsets]
+
+    with open(ds.name, "rb") as fh:
+        byteorder = "<" if fh.read(2) == b"II" else ">"
+    dtype = np.dtype(ds.dtypes[0]).newbyteorder(byteorder)
+    strip_bytes = rows_per_strip * ds.width * dtype.itemsize
+
+    if offsets[0] and all(o == offsets[0] + i * strip_bytes for i, o in enumerate(offsets)):
+        return np.memmap(ds.name, dtype=dtype, mode="r", offset=offsets[0], shape=(ds.height, ds.width))
+
+    raw = np.memmap(ds.name, dtype=np.uint8, mode="r")
+    band = np.empty((ds.height, ds.width), dtype=dtype.newbyteorder("="))
+    for i, offset in enumerate(offsets):
+        rows = band[i * rows_per_strip:(i + 1) * rows_per_strip]
+        if offset == 0:  # sparse file: strip never written
+            rows[...] = ds.nodata if ds.nodata is not None else 0
+        else:
+            rows[...] = np.frombuffer(raw, dtype=dtype, count=rows.size, offset=offset).reshape(rows.shape)
+    return band
+
+
+def _source_stamp(p: str | Path) -> str:
+    """Return ``"<size>:<mtime_ns>"`` of file *p*, identifying that exact version.
+
+    Compared for equality, not ordering: a replacement raster may well carry
+    an older timestamp (``cp -p``, ``rsync -t``, HTTP Last-Modified).
+    """
+    st = Path(p).stat()
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def _npy_cache_paths(p: str) -> Tuple[Path, Path]:
+    """Return the ``(.npy, .meta.json)`` cache files that sit next to raster *p*."""
+    return Path(p).with_suffix(".npy"), Path(p).with_suffix(".meta.json")
+
+
+def _load_npy_cache(p: str) -> _Raster | None:
+    """Return the preprocessed band of *p* from its on-disk cache, if fresh.
+
+    The tiles are memory-mapped read-only, so a warm start touches neither
+    GDAL nor more of the file than the queries actually hit.
+    """
+    npy, meta_path = _npy_cache_paths(p)
+    try:
+        meta = json.loads(meta_path.read_text())
+        if meta.get("source") != _source_stamp(p):
+            return None  # built from another version of the raster
+        if meta.get("scale") != SCALE or meta.get("tile_shift") != TILE_SHIFT:
+            return None  # written by a build with a different layout
+        tiles = np.load(npy, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+
+    inv = tuple(meta["inv"])
+    return _Raster(
+        shm=None,
+        tiles=tiles,
+        height=meta["height"],
+        width=meta["width"],
+        inv=inv,
+        rectilinear=inv[1] == 0 and inv[3] == 0,
+    )
+
+
+def _save_npy_cache(p: str, raster: _Raster) -> None:
+    """Persist *raster* next to *p* so the next process can skip GDAL entirely."""
+    npy, meta_path = _npy_cache_paths(p)
+    meta = {
+        "height": raster.height,
+        "width": raster.width,
+        "inv": list(raster.inv),
+        "scale": SCALE,
+        "tile_shift": TILE_SHIFT,
+    }
+    # Write-then-rename so a concurrent reader never sees a partial file;
+    # meta goes last because it is what vouches for the pair.  The pid keeps
+    # workers that cold-start together out of each other's way.
+    tmp = npy.with_name(f"{npy.name}.{os.getpid()}.tmp")
+    try:
+        meta["source"] = _source_stamp(p)
+        with open(tmp, "wb") as fh:
+            np.save(fh, raster.tiles)
+        os.replace(tmp, npy)
+        tmp = meta_path.with_name(f"{meta_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, meta_path)
+    except OSError:
+        # e.g. read-only data directory – just run without the cache
+        with suppress(OSError):
+            tmp.unlink(missing_ok=True)
+
+
+def _shared_name(p: str) -> str:
+    """Return the shared-memory segment name for raster *p* (changes with its version)."""
+    key = f"{p}:{_source_stamp(p)}:{SCALE}:{TILE_SHIFT}"
+    return "soil_" + hashlib.md5(key.encode()).hexdigest()[:12]
+
+
+def _attach_shared(p: str) -> _Raster | None:
+    """Return the band of *p* from a segment published by another process, if any."""
+    try:
+        name = _shared_name(p)
+        try:
+            shm = SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+        except TypeError:  # Python < 3.13
+            shm = SharedMemory(name=name)
+            # Attaching registers the segment with our resource tracker, which
+            # would unlink it on exit under the other workers' feet.
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    except OSError:
+        return None
+
+    meta_len = int.from_bytes(shm.buf[:8], "little")
+    if meta_len == 0:  # publisher still copying – don't wait, build our own
+        shm.close()
+        return None
+    meta = json.loads(bytes(shm.buf[8:8 + meta_len]))
+
+    inv = tuple(meta["inv"])
+    return _Raster(
+        shm=shm,
+        tiles=np.ndarray(tuple(meta["shape"]), dtype=np.int16, buffer=shm.buf, offset=_SHM_HEADER),
+        height=meta["height"],
+        width=meta["width"],
+        inv=inv,
+        rectilinear=inv[1] == 0 and inv[3] == 0,
+    )
+
+
+def _publish_shared(p: str, raster: _Raster) -> _Raster:
+    """Copy *raster* into a shared-memory segment other processes can attach to.
+
+    Returns the raster backed by the segment (so the private copy can be
+    freed), or *raster* unchanged if another process got there first or
+    shared memory is unavailable or too small.  The segment lives until the
+    creating process exits or :pyfunc:`close_shared` unlinks it.
+    """
+    meta = json.dumps({
+        "shape": list(raster.tiles.shape),
+        "height": raster.height,
+        "width": raster.width,
+        "inv": list(raster.inv),
+    }).encode()
+    size = _SHM_HEADER + raster.tiles.nbytes
+
+    # On Linux the segment is a sparse file on the /dev/shm tmpfs: creating
+    # it succeeds whatever its size, but touching a page the tmpfs cannot
+    # back kills the process with SIGBUS (Docker's default is only 64 MB).
+    try:
+        st = os.statvfs("/dev/shm")
+    except (AttributeError, OSError):  # not Linux – segments aren't tmpfs files
+        pass
+    else:
+        if st.f_bavail * st.f_frsize < size:
+            return raster
+
+    try:
+        shm = SharedMemory(name=_shared_name(p), create=True, size=size)
+    except OSError:
+        return raster
+
+    tiles = np.ndarray(raster.tiles.shape, dtype=np.int16, buffer=shm.buf, offset=_SHM_HEADER)
+    tiles[...] = raster.tiles
+    shm.buf[8:8 + len(meta)] = meta
+    shm.buf[:8] = len(meta).to_bytes(8, "little")  # ready flag goes last
+    atexit.register(_unlink_published, shm.name, os.getpid())
+    return raster._replace(shm=shm, tiles=tiles)
+
+
+def _unlink_published(name: str, owner_pid: int) -> None:
+    """Exit hook: remove a segment this process published (not from forked children)."""
+    if os.getpid() != owner_pid:
+        return
+    try:
+        SharedMemory(name=name).unlink()
+    except FileNotFoundError:  # already removed via close_shared(unlink=True)
+        pass
+
+
+def _get_raster(path: str | Path = DEFAULT_TIF) -> _Raster:
+    """Return the cached, in-memory copy of the raster's first band."""
+    p = str(Path(path).expanduser().resolve())
+    raster = _RASTER_CACHE.get(p)
+    if raster is not None:
+        return raster
+
+    # A freshly built band is published to shared memory, if the server opted
+    # in, for workers starting alongside us; the .npy cache is file-backed, so
+    # the OS page cache already shares it between processes.
+    raster = _attach_shared(p) or _load_npy_cache(p)
+    if raster is None:
+        ds = _get_dataset(p)
+        band = _mmap_band(ds)
+        if band is None:
+            band = ds.read(1)
+
+        inv = ~ds.transform
+        raster = _Raster(
+            shm=None,
+            tiles=to_tiles(quantize(band, ds.nodata)),
+            height=ds.height,
+            width=ds.width,
+            inv=(inv.a, inv.b, inv.c, inv.d, inv.e, inv.f),
+            rectilinear=inv.b == 0 and inv.d == 0,
+        )
+        _save_npy_cache(p, raster)
+        if os.environ.get(SHARED_MEMORY_ENV, "0") not in {"", "0"}:
+            raster = _publish_shared(p, raster)
+
+    _RASTER_CACHE.set(p, raster)
+    return raster
+
+
+def _lonlat_to_rowcol(raster: _Raster, lon: float, lat: float) -> Tuple[int, int]:
+    """Map (*lon*, *lat*) to the (row, col) pixel index of *raster*."""
+    a, b, c, d, e, f = raster.inv
+    # floor() rather than int(): truncation would map points just above/left
+    # of the raster onto row/col 0.
+    if raster.rectilinear:  # north-up grids: one multiply-add per axis
+        return math.floor(lat * e + f), math.floor(lon * a + c)
+    return math.floor(lon * d + lat * e + f), math.floor(lon * a + lat * b + c)
+
+
+def _pixel_at(raster: _Raster, lat: float, lon: float) -> np.int16 | None:
+    """Return the quantised pixel at (*lat*, *lon*), or *None* if off-raster."""
+    row, col = _lonlat_to_rowcol(raster, lon, lat)
+    if not (0 <= row < raster.height and 0 <= col < raster.width):
+        return None
+    return raster.tiles[row >> TILE_SHIFT, col >> TILE_SHIFT, row & TILE_MASK, col & TILE_MASK]
+
+
+def _open_geocode_db() -> sqlite3.Connection:
+    """Open (creating if needed) the persistent geocode cache at :pydata:`GEOCODE_DB`."""
+    GEOCODE_DB.parent.mkdir(parents=True, exist_ok=True)
+    con = sqlite3.connect(GEOCODE_DB, timeout=5)
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS geocode "
+        "(address TEXT PRIMARY KEY, lat REAL, lon REAL, ts INTEGER)"
+    )
+    return con
+
+
+def _geocode_db_get(address: str) -> Tuple[float, float] | None:
+    """Return the stored (lat, lon) for *address*, or *None* on a miss."""
+    try:
+        with closing(_open_geocode_db()) as con:
+            row = con.execute("SELECT lat, lon FROM geocode WHERE address = ?", (address,)).fetchone()
+    except (OSError, sqlite3.Error):  # unwritable home, locked db, ... – just miss
+        return None
+    return None if row is None else (row[0], row[1])
+
+
+def _geocode_db_put(address: str, lat: float, lon: float) -> None:
+    """Store a geocoding result; failures only cost a future cache miss."""
+    try:
+        with closing(_open_geocode_db()) as con, con:
+            con.execute(
+                "INSERT OR REPLACE INTO geocode (address, lat, lon, ts) VALUES (?, ?, ?, ?)",
+                (address, lat, lon, int(time.time())),
+            )
+    except (OSError, sqlite3.Error):
+        pass
+
+
+@lru_cache(maxsize=4096)
 def _geocode(address: str) -> Tuple[float, float]:
-    """Geocode *address* to (lat, lon) using Nominatim with aggressive caching."""
+    """Geocode *address* to (lat, lon) using Nominatim with aggressive caching.
+
+    Results are memoised in-process and persisted in :pydata:`GEOCODE_DB`, so
+    only the first lookup of an address on this machine hits the network.
+    """
+    cached = _geocode_db_get(address)
+    if cached is not None:
+        return cached
+
     if Nominatim is None:  # pragma: no cover – optional dependency missing
         raise RuntimeError("geopy is required for address lookup. Install via `pip install geopy`."
                            )
@@ -95,6 +597,7 @@ def _geocode(address: str) -> Tuple[float, float]:
     loc = _GEOLOCATOR_CACHE["nominatim"].geocode(address, timeout=5)  # type: ignore[index]
     if loc is None:
         raise ValueError(f"Address not found: {address!r}")
+    _geocode_db_put(address, loc.latitude, loc.longitude)
     return loc.latitude, loc.longitude
 
 
@@ -129,21 +632,118 @@ def get_soil_temperature(
     else:
         lat, lon = address_or_coord
 
-    ds = _get_dataset(tif_path)
+    raster = _get_raster(tif_path)
+    value = _pixel_at(raster, lat, lon)
+    if value is None or value == SENTINEL:  # off-raster or nodata
+        return None
+    return float(value) / SCALE
 
-    # Rasterio expects (lon, lat) order for geographic CRS.
-    sample_iter = ds.sample([(lon, lat)])
+
+def get_soil_temperatures(
+    addresses_or_coords: Sequence[str | Tuple[float, float]] | np.ndarray,
+    *,
+    tif_path: str | Path = DEFAULT_TIF,
+) -> np.ndarray:
+    """Return the soil temperatures (°C) for many locations at once.
+
+    Addresses are geocoded one by one (through the same cache as
+    :pyfunc:`get_soil_temperature`); the pixel lookups then run as a single
+    batch via :pyfunc:`get_soil_temperatures_batch`.
+
+    Parameters
+    ----------
+    addresses_or_coords
+        Sequence whose items are street addresses or ``(lat, lon)`` tuples, or
+        an ``(N, 2)`` array of ``(lat, lon)`` rows.
+    tif_path
+        Path to the GeoTIFF raster.  Defaults to the global dataset shipped
+        with the repository.
+
+    Returns
+    -------
+    numpy.ndarray
+        1-D float array aligned with *addresses_or_coords*.  Points that fall
+        outside the raster or on a nodata pixel are *NaN*.
+
+    Raises
+    ------
+    ValueError
+        If the items are not all addresses or ``(lat, lon)`` pairs.
+    """
+    # Pure coordinate input converts in one C-level pass; only walk the items
+    # in Python when there are addresses to geocode.
     try:
-        value = next(sample_iter)[0]
-    except StopIteration:  # improbable
-        return None
+        pts = np.asarray(addresses_or_coords, dtype=np.float64)
+    except (TypeError, ValueError):
+        pts = None
+    if pts is None or (pts.size and (pts.ndim != 2 or pts.shape[1] != 2)):
+        pts = np.array(
+            [_geocode(p) if isinstance(p, str) else p for p in addresses_or_coords],
+            dtype=np.float64,
+        )
+    if pts.size == 0:
+        pts = np.empty((0, 2))
+    elif pts.ndim != 2 or pts.shape[1] != 2:
+        raise ValueError(
+            f"expected addresses or (lat, lon) pairs, got an array of shape {pts.shape}"
+        )
+
+    # One transposing copy gives contiguous lat and lon rows for the kernel.
+    lats, lons = np.ascontiguousarray(pts.T)
+    return get_soil_temperatures_batch(lats, lons, tif_path=tif_path)
+
+
+def get_soil_temperatures_batch(
+    lats: Sequence[float] | np.ndarray,
+    lons: Sequence[float] | np.ndarray,
+    *,
+    tif_path: str | Path = DEFAULT_TIF,
+    spatial_sort: bool = False,
+) -> np.ndarray:
+    """Return the soil temperatures (°C) for parallel *lats* / *lons* arrays.
 
-    # Handle nodata / masked values.
-    if ds.nodata is not None and np.isclose(value, ds.nodata):
-        return None
-    if np.isnan(value):
-        return None
-    return float(value)
+    This is the bulk kernel behind :pyfunc:`get_soil_temperatures`: the whole
+    lon/lat → pixel → nodata loop runs in compiled, parallel code when Numba
+    is installed (vectorised NumPy otherwise) against the preloaded band.
+
+    Parameters
+    ----------
+    lats, lons
+        Latitudes and longitudes in degrees, of equal length.
+    tif_path
+        Path to the GeoTIFF raster.  Defaults to the global dataset shipped
+        with the repository.
+    spatial_sort
+        Visit the points in Z-order (Morton) of the tile they fall into so
+        that clustered queries reuse the same tiles back to back.  The sort
+        costs more than it saves while the band is RAM-resident, so only
+        enable it for very large batches against paged-out data.
+
+    Returns
+    -------
+    numpy.ndarray
+        1-D float array aligned with the inputs.  Points that fall outside the
+        raster or on a nodata pixel are *NaN*.
+    """
+    lats = np.ascontiguousarray(lats, dtype=np.float64).ravel()
+    lons = np.ascontiguousarray(lons, dtype=np.float64).ravel()
+    if lats.shape != lons.shape:
+        raise ValueError(f"lats and lons differ in length ({lats.size} vs {lons.size})")
+
+    raster = _get_raster(tif_path)
+    out = np.empty(lats.shape[0])
+    if not spatial_sort:
+        sample_points(raster.tiles, raster.height, raster.width, lats, lons, raster.inv, out)
+        return out
+
+    order = morton_order(lats, lons, raster.inv, raster.height, raster.width)
+    sorted_out = np.empty_like(out)
+    sample_points(
+        raster.tiles, raster.height, raster.width,
+        lats[order], lons[order], raster.inv, sorted_out,
+    )
+    out[order] = sorted_out
+    return out
 
 
 # ------------- NEW PUBLIC API -------------------------------------------------
@@ -156,6 +756,8 @@ def get_soil_temperatures_in_bbox(
 ) -> np.ndarray | None:
     """Return all soil-temperature pixel values that fall inside *bbox*.
 
+    Pixels only partly covered by the box are included.
+
     Parameters
     ----------
     bbox
@@ -167,7 +769,8 @@ def get_soil_temperatures_in_bbox(
     masked
         If *True*, the returned array is a :pyclass:`numpy.ma.MaskedArray` with
         nodata pixels masked out.  If *False* (default) nodata pixels are
-        converted to *NaN* and a plain :class:`numpy.ndarray` is returned.
+        converted to *NaN* and a plain ``float32`` :class:`numpy.ndarray` is
+        returned.
 
     Returns
     -------
@@ -181,39 +784,70 @@ def get_soil_temperatures_in_bbox(
     south, west, north, east = lat_min, lon_min, lat_max, lon_max
 
     ds = _get_dataset(tif_path)
+    t = ds.transform
 
-    # Quick reject if the bbox does not intersect the raster at all.
-    if east < ds.bounds.left or west > ds.bounds.right or \
-       north < ds.bounds.bottom or south > ds.bounds.top:
+    if t.b == 0 and t.d == 0 and t.a > 0 and t.e < 0:
+        # North-up grid: one division per edge.
+        col_lo, col_hi = (west - t.c) / t.a, (east - t.c) / t.a
+        row_lo, row_hi = (north - t.f) / t.e, (south - t.f) / t.e
+    else:
+        # Any other grid (south-up, rotated): the pixel-space extent of the
+        # box's four corners.
+        inv = ~t
+        corners = ((west, north), (east, north), (west, south), (east, south))
+        cols = [inv.a * x + inv.b * y + inv.c for x, y in corners]
+        rows = [inv.d * x + inv.e * y + inv.f for x, y in corners]
+        col_lo, col_hi, row_lo, row_hi = min(cols), max(cols), min(rows), max(rows)
+
+    # Every pixel the box touches is included, clipped to the raster; the
+    # epsilon keeps edges that sit on pixel boundaries from grabbing a
+    # neighbour.
+    col_off = max(math.floor(col_lo + _PIXEL_EPS), 0)
+    col_end = min(math.ceil(col_hi - _PIXEL_EPS), ds.width)
+    row_off = max(math.floor(row_lo + _PIXEL_EPS), 0)
+    row_end = min(math.ceil(row_hi - _PIXEL_EPS), ds.height)
+    if col_end <= col_off or row_end <= row_off:  # nothing to read
         return None
 
-    from rasterio.windows import from_bounds, Window
-
-    # Build a read window (expressed in pixel coordinates).
-    window = from_bounds(
-        west, south, east, north,
-        transform=ds.transform,
-    ).round_offsets().round_lengths()
+    raw = ds.read(1, window=Window(col_off, row_off, col_end - col_off, row_end - row_off))
 
-    # Clip the window to the dataset extent in case *boundless* stretched it.
-    full_window = Window(0, 0, ds.width, ds.height)
-    window = window.intersection(full_window)
-
-    if window.width <= 0 or window.height <= 0:  # nothing to read
-        return None
-
-    data = ds.read(1, window=window, masked=True)  # read as MaskedArray
+    # A single boolean pass finds the nodata pixels; it drives the empty check
+    # and both return flavours.
+    invalid = nodata_mask(raw, ds.nodata)
 
     # Shortcut: if everything is nodata just return None.
-    if data.mask.all():
+    if invalid.all():
         return None
 
     if masked:
-        return data  # user wants the mask preserved
+        # User wants the mask preserved – wrap the buffer, don't copy it.
+        return np.ma.MaskedArray(raw, mask=invalid, copy=False, fill_value=ds.nodata)
+
+    # Otherwise convert nodata to NaN in place on a float32 buffer (no copy
+    # when the band already is float32).
+    out = raw.astype(np.float32, copy=False)
+    out[invalid] = np.nan
+    return out
 
-    # Otherwise convert masked values to NaN and return ndarray.
-    filled = data.filled(np.nan).astype(float)
-    return filled
+
+def close_shared(*, unlink: bool = False) -> None:
+    """Release the shared-memory segments held by this process.
+
+    Segments are only published when :pydata:`SHARED_MEMORY_ENV` is set.
+    Call from a worker's shutdown hook.  The mappings are dropped from the
+    cache and unmapped once no array views them any more.  With *unlink* the
+    segments are also removed system-wide – do that only from the last process
+    using them (e.g. the server's master on shutdown).
+    """
+    for p, raster in _RASTER_CACHE.items():
+        if raster.shm is None:
+            continue
+        _RASTER_CACHE.pop(p)
+        if unlink:
+            try:
+                raster.shm.unlink()
+            except FileNotFoundError:
+                pass
 
 
 # -----------------------------------------------------------------------------
@@ -221,7 +855,7 @@ def get_soil_temperatures_in_bbox(
 # -----------------------------------------------------------------------------
 
 if __name__ == "__main__":  # pragma: no cover – CLI entry-point
-    import argparse, json, sys
+    import argparse, sys
 
     parser = argparse.ArgumentParser(description="Return mean soil temperature for a street address.")
     parser.add_argument("address", help="The street address to look up.")
@@ -0,0 +1,72 @@
+"""Regression tests for :pyfunc:`soil_temp_lookup._mmap_band`.
+
+The memory-mapped fast path decodes the TIFF strips itself, so it is checked
+against GDAL's own ``ds.read(1)`` for every layout it claims to handle, and
+for the layouts it must refuse.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+from rasterio.windows import Window
+
+from soil_temp_lookup import _mmap_band
+
+HEIGHT, WIDTH, ROWS_PER_STRIP = 37, 19, 5  # last strip is ragged (2 rows)
+
+
+def _write(path, data, *, reverse=False, **options):
+    """Write *data* as a strip GeoTIFF, optionally storing the strips bottom-up."""
+    profile = dict(
+        driver="GTiff", height=HEIGHT, width=WIDTH, count=1, dtype=data.dtype.name,
+        blockysize=ROWS_PER_STRIP, crs="EPSG:4326", transform=from_origin(0, HEIGHT, 1, 1),
+    )
+    profile.update(options)
+    with rasterio.open(path, "w", **profile) as dst:
+        starts = range(0, HEIGHT, ROWS_PER_STRIP)
+        for row in reversed(starts) if reverse else starts:
+            rows = data[row:row + ROWS_PER_STRIP]
+            dst.write(rows, 1, window=Window(0, row, WIDTH, rows.shape[0]))
+
+
+def _band(dtype):
+    return (np.arange(HEIGHT * WIDTH) % 120 - 20).astype(dtype).reshape(HEIGHT, WIDTH)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64", "int16", "uint8"])
+@pytest.mark.parametrize("endian", ["little", "big"])
+@pytest.mark.parametrize("reverse", [False, True], ids=["in-order", "reversed"])
+def test_matches_gdal(tmp_path, dtype, endian, reverse):
+    path = tmp_path / "band.tif"
+    _write(path, _band(dtype), reverse=reverse, endianness=endian)
+    with rasterio.open(path) as ds:
+        band = _mmap_band(ds)
+        assert band is not None
+        np.testing.assert_array_equal(band, ds.read(1))
+
+
+def test_sparse_strips(tmp_path):
+    data = _band("float32")
+    data[10:20] = -9999  # strips 2 and 3 are all nodata and never written
+    path = tmp_path / "sparse.tif"
+    _write(path, data, nodata=-9999, sparse_ok=True)
+    with rasterio.open(path) as ds:
+        # Depending on the GDAL version the missing strips report offset 0
+        # (filled with nodata here) or no offset at all (left to GDAL).
+        band = _mmap_band(ds)
+        if band is not None:
+            np.testing.assert_array_equal(band, ds.read(1))
+
+
+@pytest.mark.parametrize("options", [
+    {"compress": "deflate"},
+    {"tiled": True, "blockxsize": 16, "blockysize": 16},
+    {"nbits": 4},
+], ids=["compressed", "tiled", "nbits"])
+def test_refuses_layouts_it_cannot_decode(tmp_path, options):
+    path = tmp_path / "other.tif"
+    _write(path, _band("uint8") % 16, **options)
+    with rasterio.open(path) as ds:
+        assert _mmap_band(ds) is None
@@ -0,0 +1,257 @@
+"""Tests for the lookup API of :pymod:`soil_temp_lookup` and its :pymod:`_kernel`."""
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+import warnings
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import Affine, from_origin
+
+import _kernel
+import soil_temp_lookup as stl
+from _kernel import SCALE, SENTINEL, morton_order, nodata_mask, quantize, to_tiles
+
+HEIGHT, WIDTH = 10, 20
+SOUTH = 40  # latitude of the bottom edge; keeps the south-up transform off identity
+NODATA = -9999.0
+
+
+def _grid():
+    return np.arange(HEIGHT * WIDTH, dtype=np.float32).reshape(HEIGHT, WIDTH)
+
+
+def _write(path, data, transform, **options):
+    profile = dict(
+        driver="GTiff", height=data.shape[0], width=data.shape[1], count=1,
+        dtype=data.dtype.name, crs="EPSG:4326", transform=transform, nodata=NODATA,
+    )
+    profile.update(options)
+    with rasterio.open(path, "w", **profile) as dst:
+        dst.write(data, 1)
+    return path
+
+
+@pytest.fixture
+def north_up(tmp_path):
+    """1° pixels covering lon 0…20, lat 40…50, row 0 at the top."""
+    return _write(tmp_path / "north_up.tif", _grid(), from_origin(0, SOUTH + HEIGHT, 1, 1))
+
+
+@pytest.fixture
+def south_up(tmp_path):
+    """The same field stored bottom row first (positive y pixel size)."""
+    return _write(tmp_path / "south_up.tif", _grid()[::-1].copy(), Affine(1, 0, 0, 0, 1, SOUTH))
+
+
+# -----------------------------------------------------------------------------
+# Bounding boxes
+# -----------------------------------------------------------------------------
+
+def test_bbox_on_pixel_boundaries(north_up):
+    # Edges exactly on the grid must not grab the neighbouring row/column.
+    out = stl.get_soil_temperatures_in_bbox((42, 3, 45, 7), tif_path=north_up)
+    np.testing.assert_array_equal(out, _grid()[5:8, 3:7])
+
+
+def test_bbox_off_grid_includes_partial_pixels(north_up):
+    out = stl.get_soil_temperatures_in_bbox((42.5, 3.2, 44.5, 6.7), tif_path=north_up)
+    np.testing.assert_array_equal(out, _grid()[5:8, 3:7])
+
+
+def test_bbox_clipped_at_raster_edge(north_up):
+    out = stl.get_soil_temperatures_in_bbox((35, -5, 43, 4), tif_path=north_up)
+    np.testing.assert_array_equal(out, _grid()[7:10, 0:4])
+
+
+def test_bbox_outside_raster(north_up):
+    assert stl.get_soil_temperatures_in_bbox((60, 30, 65, 35), tif_path=north_up) is None
+
+
+def test_bbox_same_pixels_on_south_up_grid(north_up, south_up):
+    for bbox in [(42, 3, 45, 7), (42.5, 3.2, 44.5, 6.7), (35, -5, 43, 4)]:
+        expected = stl.get_soil_temperatures_in_bbox(bbox, tif_path=north_up)
+        out = stl.get_soil_temperatures_in_bbox(bbox, tif_path=south_up)
+        np.testing.assert_array_equal(out, expected[::-1])
+
+
+def test_bbox_nodata(tmp_path):
+    data = _grid()
+    data[5, 3] = NODATA
+    path = _write(tmp_path / "nd.tif", data, from_origin(0, SOUTH + HEIGHT, 1, 1))
+
+    out = stl.get_soil_temperatures_in_bbox((42, 3, 45, 7), tif_path=path)
+    assert out.dtype == np.float32 and np.isnan(out[0, 0]) and np.isnan(out).sum() == 1
+
+    out = stl.get_soil_temperatures_in_bbox((42, 3, 45, 7), tif_path=path, masked=True)
+    assert out.mask[0, 0] and out.mask.sum() == 1
+
+
+# -----------------------------------------------------------------------------
+# Quantisation
+# -----------------------------------------------------------------------------
+
+def test_nodata_mask_float32_sentinel_matches_exactly():
+    sentinel = float(np.finfo(np.float32).min)  # as GDAL reports it: float64
+    arr = np.array([1.0, sentinel, np.nan, np.nextafter(np.float32(sentinel), 0)], dtype=np.float32)
+    np.testing.assert_array_equal(nodata_mask(arr, sentinel), [False, True, True, False])
+
+
+def test_nodata_mask_integer_bands():
+    arr = np.array([0, 255, 7], dtype=np.uint8)
+    np.testing.assert_array_equal(nodata_mask(arr, 255), [False, True, False])
+    # A nodata the dtype cannot hold matches nothing instead of wrapping.
+    np.testing.assert_array_equal(nodata_mask(arr, -1), [False, False, False])
+    np.testing.assert_array_equal(nodata_mask(arr, 7.5), [False, False, False])
+    np.testing.assert_array_equal(nodata_mask(arr, None), [False, False, False])
+
+
+def test_quantize_rounds_clips_and_marks_nodata():
+    sentinel = float(np.finfo(np.float32).min)
+    arr = np.array([12.344, -3.456, 1000.0, -1000.0, np.nan, sentinel], dtype=np.float32)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # the ±3.4e38 sentinel must not overflow
+        q = quantize(arr, sentinel)
+    assert q.dtype == np.int16
+    np.testing.assert_array_equal(q, [1234, -346, 32767, SENTINEL + 1, SENTINEL, SENTINEL])
+    assert abs(q[0] / SCALE - 12.344) <= 0.5 / SCALE
+
+
+# -----------------------------------------------------------------------------
+# Point kernel
+# -----------------------------------------------------------------------------
+
+@pytest.fixture(params=["numba", "numpy"])
+def kernel(request, monkeypatch):
+    """:pymod:`_kernel` with the Numba kernels, and a copy with the NumPy fallback."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+        return _kernel
+    monkeypatch.setitem(sys.modules, "numba", None)
+    spec = importlib.util.spec_from_file_location("_kernel_numpy", _kernel.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_sample_points_non_finite_coordinates(kernel):
+    band = np.arange(16, dtype=np.int16).reshape(4, 4)
+    inv = (1.0, 0.0, 0.0, 0.0, -1.0, 4.0)  # 1° pixels, lon 0…4, lat 0…4
+    lats = np.array([np.nan, np.inf, 1.5, -np.inf, 3.5])
+    lons = np.array([1.5, 1.5, np.nan, 1.5, 0.5])
+    out = np.empty(lats.shape)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        kernel.sample_points(to_tiles(band), 4, 4, lats, lons, inv, out)
+    np.testing.assert_array_equal(out, [np.nan, np.nan, np.nan, np.nan, 0 / SCALE])
+
+
+def test_morton_order_non_finite_coordinates():
+    lats = np.array([np.nan, 3.5, np.inf, 0.5, -np.inf])
+    lons = np.array([0.5, np.nan, 1e308, 3.5, 0.5])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        order = morton_order(lats, lons, (1.0, 0.0, 0.0, 0.0, -1.0, 4.0), 4, 4)
+    assert sorted(order) == list(range(5))
+
+
+# -----------------------------------------------------------------------------
+# On-disk cache
+# -----------------------------------------------------------------------------
+
+def test_npy_cache_rejects_replacement_with_older_mtime(tmp_path, north_up):
+    p = str(north_up)
+    stl._save_npy_cache(p, stl._get_raster(p))
+    stl._RASTER_CACHE.pop(p)
+    assert stl._load_npy_cache(p) is not None
+
+    # Replace the raster by another version that carries an *older* mtime,
+    # as cp -p / rsync -t / wget leave it.
+    old = north_up.stat().st_mtime_ns - 10**9
+    _write(north_up, _grid() + 1, from_origin(0, SOUTH + HEIGHT, 1, 1))
+    os.utime(north_up, ns=(old, old))
+    assert stl._load_npy_cache(p) is None
+
+
+# -----------------------------------------------------------------------------
+# Batch input
+# -----------------------------------------------------------------------------
+
+def test_batch_accepts_pairs_and_empty(north_up):
+    expected = [_grid()[5, 3], _grid()[9, 0]]
+    for pts in ([(44.5, 3.5), (40.5, 0.5)], np.array([[44.5, 3.5], [40.5, 0.5]])):
+        np.testing.assert_allclose(stl.get_soil_temperatures(pts, tif_path=north_up), expected)
+    assert stl.get_soil_temperatures([], tif_path=north_up).shape == (0,)
+
+
+@pytest.mark.parametrize("pts", [
+    [(44.5, 3.5, 100.0), (40.5, 0.5, 200.0)],  # (lat, lon, elevation)
+    [44.5, 3.5, 40.5, 0.5],  # flat list
+    (44.5, 3.5),  # a bare pair instead of a list of pairs
+    np.zeros((2, 3)),
+], ids=["triples", "flat", "bare-pair", "array-2x3"])
+def test_batch_rejects_non_pairs(north_up, pts):
+    with pytest.raises(ValueError):
+        stl.get_soil_temperatures(pts, tif_path=north_up)
+
+
+# -----------------------------------------------------------------------------
+# GDAL configuration
+# -----------------------------------------------------------------------------
+
+def test_nodata_from_pam_sidecar(tmp_path):
+    # nodata stored only in the .aux.xml sidecar, not in the TIFF itself
+    data = _grid()
+    data[5, 3] = -1
+    path = _write(tmp_path / "pam.tif", data, from_origin(0, SOUTH + HEIGHT, 1, 1), nodata=None)
+    (tmp_path / "pam.tif.aux.xml").write_text(
+        '<PAMDataset><PAMRasterBand band="1"><NoDataValue>-1</NoDataValue></PAMRasterBand></PAMDataset>'
+    )
+    assert stl._get_dataset(path).nodata == -1
+    assert stl.get_soil_temperature((44.5, 3.5), tif_path=path) is None
+    assert stl.get_soil_temperature((44.5, 4.5), tif_path=path) == data[5, 4]
+
+
+def test_gdal_cache_respects_callers_env(tmp_path):
+    path = _write(tmp_path / "cache.tif", _grid(), from_origin(0, SOUTH + HEIGHT, 1, 1))
+    stl._size_gdal_cache.cache_clear()
+    with rasterio.Env(GDAL_CACHEMAX=64 << 20):
+        stl._get_dataset(path)
+        assert rasterio.env.get_gdal_config("GDAL_CACHEMAX") == 64 << 20
+
+
+# -----------------------------------------------------------------------------
+# Pre-warped copies of projected rasters
+# -----------------------------------------------------------------------------
+
+def _write_mercator(path, value):
+    data = np.full((20, 20), value, dtype=np.float32)
+    return _write(path, data, from_origin(0, 1e6, 1e4, 1e4), crs="EPSG:3857", nodata=None)
+
+
+def _prewarp(path):
+    src = rasterio.open(path)
+    ds = stl._open_prewarped(src)
+    try:
+        return ds.name, np.nanmax(ds.read(1, masked=True))
+    finally:
+        ds.close()
+
+
+def test_prewarped_copy_follows_source_version(tmp_path):
+    path = _write_mercator(tmp_path / "merc.tif", 1.0)
+    name, value = _prewarp(path)
+    assert name.endswith("merc.tif.4326.tif") and value == 1.0
+
+    built = os.stat(name).st_mtime_ns
+    assert _prewarp(path)[1] == 1.0
+    assert os.stat(name).st_mtime_ns == built  # unchanged source: reused as is
+
+    # A replacement with an *older* mtime must still trigger a rebuild.
+    old = path.stat().st_mtime_ns - 10**9
+    _write_mercator(path, 2.0)
+    os.utime(path, ns=(old, old))
+    assert _prewarp(path)[1] == 2.0